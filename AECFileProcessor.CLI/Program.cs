@@ -1,4 +1,5 @@
 using AECFileProcessor.Core.Interfaces;
+using AECFileProcessor.Core.Models;
 using AECFileProcessor.Core.Services;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Hosting;
@@ -46,7 +47,14 @@ class Program
             return 1;
         }
 
-        await RunWatchModeAsync(path, database);
+        if (!TryParseHashConcurrency(args, out var hashConcurrency))
+        {
+            Console.WriteLine("Error: --hash-concurrency must be a positive number");
+            Console.WriteLine("Usage: aec-processor watch --path <directory> [--database <path>] [--hash-concurrency <count>]");
+            return 1;
+        }
+
+        await RunWatchModeAsync(path, database, hashConcurrency);
         return 0;
     }
 
@@ -60,7 +68,14 @@ class Program
             return 1;
         }
 
-        await RunProcessModeAsync(path, database);
+        if (!TryParseHashConcurrency(args, out var hashConcurrency))
+        {
+            Console.WriteLine("Error: --hash-concurrency must be a positive number");
+            Console.WriteLine("Usage: aec-processor process --path <directory> [--database <path>] [--hash-concurrency <count>]");
+            return 1;
+        }
+
+        await RunProcessModeAsync(path, database, hashConcurrency);
         return 0;
     }
 
@@ -137,6 +152,21 @@ class Program
         return null;
     }
 
+    static bool TryParseHashConcurrency(string[] args, out int? hashConcurrency)
+    {
+        hashConcurrency = null;
+        for (int i = 0; i < args.Length - 1; i++)
+        {
+            if (args[i] == "--hash-concurrency")
+            {
+                if (!int.TryParse(args[i + 1], out var value) || value <= 0)
+                    return false;
+                hashConcurrency = value;
+            }
+        }
+        return true;
+    }
+
     static (string name, string number) ParseProjectNameAndNumber(string[] args)
     {
         string name = "";
@@ -171,6 +201,8 @@ class Program
         Console.WriteLine("  --project         Project number to query");
         Console.WriteLine("  --name            Project name (for create-project)");
         Console.WriteLine("  --number          Project number (for create-project)");
+        Console.WriteLine("  --hash-concurrency");
+        Console.WriteLine("                    Files hashed at once for watch/process (default: CPU count, use 1 on HDDs)");
         Console.WriteLine();
         Console.WriteLine("Examples:");
         Console.WriteLine("  aec-processor watch --path \"C:\\Projects\\Project123\"");
@@ -188,16 +220,16 @@ class Program
         return 1;
     }
 
-    static async Task RunWatchModeAsync(string watchPath, string databasePath)
+    static async Task RunWatchModeAsync(string watchPath, string databasePath, int? hashConcurrency)
     {
-        var host = CreateHost(databasePath);
+        var host = CreateHost(databasePath, hashConcurrency);
         var services = host.Services;
         
         var logger = services.GetRequiredService<ILogger<Program>>();
         var processor = services.GetRequiredService<IFileProcessor>();
         
-        logger.LogInformation($"Starting file watcher for: {watchPath}");
-        logger.LogInformation($"Database: {databasePath}");
+        logger.LogInformation("Starting file watcher for: {WatchPath}", watchPath);
+        logger.LogInformation("Database: {DatabasePath}", databasePath);
         
         using var watcher = new LocalFileWatcher(watchPath, processor, 
             services.GetRequiredService<ILogger<LocalFileWatcher>>());
@@ -223,45 +255,47 @@ class Program
         }
     }
 
-    static async Task RunProcessModeAsync(string processPath, string databasePath)
+    static async Task RunProcessModeAsync(string processPath, string databasePath, int? hashConcurrency)
     {
-        var host = CreateHost(databasePath);
+        var host = CreateHost(databasePath, hashConcurrency);
         var services = host.Services;
         
         var logger = services.GetRequiredService<ILogger<Program>>();
         var processor = services.GetRequiredService<IFileProcessor>();
         
-        logger.LogInformation($"Processing files in: {processPath}");
-        
-        var files = Directory.GetFiles(processPath, "*.*", SearchOption.AllDirectories)
-            .Where(f => ShouldProcessFile(f))
-            .ToList();
-            
-        logger.LogInformation($"Found {files.Count} files to process");
+        logger.LogInformation("Processing files in: {ProcessPath}", processPath);
         
+        // Stream paths from the directory walk straight to the workers instead of
+        // collecting the whole tree first, so large projects start processing at once
+        // and memory stays flat regardless of file count
+        var files = FileFilter.EnumerateFiles(processPath);
+
         var processed = 0;
         var errors = 0;
-        
-        foreach (var file in files)
+
+        // Hashing and parsing are CPU/IO bound per file, so process files in parallel
+        // with the same concurrency limit the file watcher uses
+        var options = new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount };
+        await Parallel.ForEachAsync(files, options, async (file, _) =>
         {
             try
             {
                 await processor.ProcessFileAsync(file);
-                processed++;
-                
-                if (processed % 10 == 0)
+                var count = Interlocked.Increment(ref processed);
+
+                if (count % 10 == 0)
                 {
-                    logger.LogInformation($"Processed {processed}/{files.Count} files");
+                    logger.LogInformation("Processed {Count} files", count);
                 }
             }
             catch (Exception ex)
             {
-                logger.LogError(ex, $"Failed to process: {file}");
-                errors++;
+                logger.LogError(ex, "Failed to process: {FilePath}", file);
+                Interlocked.Increment(ref errors);
             }
-        }
+        });
         
-        logger.LogInformation($"Processing complete. Processed: {processed}, Errors: {errors}");
+        logger.LogInformation("Processing complete. Processed: {Processed}, Errors: {Errors}", processed, errors);
     }
 
     static async Task RunQueryModeAsync(string? projectNumber, string databasePath)
@@ -294,7 +328,7 @@ class Program
             {
                 Console.WriteLine($"  {file.FileName}");
                 Console.WriteLine($"    Discipline: {file.Discipline}, Phase: {file.Phase}");
-                Console.WriteLine($"    Status: {file.Status}, Modified: {file.ModifiedDate:yyyy-MM-dd HH:mm}");
+                Console.WriteLine($"    Status: {file.Status}, Modified: {file.ModifiedDate.ToLocalTime():yyyy-MM-dd HH:mm}");
                 Console.WriteLine();
             }
             
@@ -311,7 +345,7 @@ class Program
         var structureService = host.Services.GetRequiredService<IProjectStructureService>();
         var logger = host.Services.GetRequiredService<ILogger<Program>>();
 
-        logger.LogInformation($"Creating project structure for {projectName}_{projectNumber} at {basePath}");
+        logger.LogInformation("Creating project structure for {ProjectName}_{ProjectNumber} at {BasePath}", projectName, projectNumber, basePath);
 
         var success = await structureService.CreateProjectStructureAsync(basePath, projectName, projectNumber);
 
@@ -341,7 +375,7 @@ class Program
         var structureService = host.Services.GetRequiredService<IProjectStructureService>();
         var logger = host.Services.GetRequiredService<ILogger<Program>>();
 
-        logger.LogInformation($"Validating project structure at: {projectPath}");
+        logger.LogInformation("Validating project structure at: {ProjectPath}", projectPath);
 
         var status = await structureService.GetProjectStructureStatusAsync(projectPath);
 
@@ -384,8 +418,14 @@ class Program
         }
     }
 
-    static IHost CreateHost(string databasePath)
+    static IHost CreateHost(string databasePath, int? hashConcurrency = null)
     {
+        var processingOptions = new FileProcessingOptions();
+        if (hashConcurrency.HasValue)
+        {
+            processingOptions.MaxConcurrentHashes = hashConcurrency.Value;
+        }
+
         return Host.CreateDefaultBuilder()
             .ConfigureServices((context, services) =>
             {
@@ -397,6 +437,7 @@ class Program
                 
                 // Use in-memory repository for now (will add SQLite later)
                 services.AddSingleton<IFileRepository, InMemoryFileRepository>();
+                services.AddSingleton(processingOptions);
                 services.AddSingleton<IFileProcessor, BasicFileProcessor>();
                 services.AddSingleton<IProjectStructureService, ProjectStructureService>();
             })
@@ -418,15 +459,4 @@ class Program
             })
             .Build();
     }
-
-    static bool ShouldProcessFile(string filePath)
-    {
-        var extension = Path.GetExtension(filePath).ToLower();
-        var fileName = Path.GetFileName(filePath);
-        
-        if (fileName.StartsWith("~") || fileName.StartsWith(".tmp") || fileName.Contains("$"))
-            return false;
-            
-        return extension is ".dwg" or ".pdf" or ".docx" or ".xlsx" or ".rvt" or ".ifc";
-    }
 }
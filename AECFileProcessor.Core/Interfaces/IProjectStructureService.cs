@@ -3,10 +3,18 @@ namespace AECFileProcessor.Core.Interfaces;
 public interface IProjectStructureService
 {
     Task<bool> CreateProjectStructureAsync(string projectPath, string projectName, string projectNumber);
+    Task<IReadOnlyList<bool>> CreateProjectStructuresAsync(IReadOnlyList<ProjectStructureRequest> requests);
     Task<bool> ValidateProjectStructureAsync(string projectPath);
     Task<ProjectStructureStatus> GetProjectStructureStatusAsync(string projectPath);
 }
 
+public class ProjectStructureRequest
+{
+    public string ProjectPath { get; set; } = string.Empty;
+    public string ProjectName { get; set; } = string.Empty;
+    public string ProjectNumber { get; set; } = string.Empty;
+}
+
 public class ProjectStructureStatus
 {
     public bool IsValidStructure { get; set; }
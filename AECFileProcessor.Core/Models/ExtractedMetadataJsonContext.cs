@@ -0,0 +1,10 @@
+using System.Text.Json.Serialization;
+
+namespace AECFileProcessor.Core.Models;
+
+// Serializer for ExtractedMetadata generated at compile time, so saving a record doesn't
+// go through reflection-based type discovery the first time and per-call metadata lookups after
+[JsonSerializable(typeof(ExtractedMetadata))]
+internal partial class ExtractedMetadataJsonContext : JsonSerializerContext
+{
+}
@@ -0,0 +1,12 @@
+namespace AECFileProcessor.Core.Models;
+
+public class FileProcessingOptions
+{
+    // Number of files hashed at the same time. Set to 1 for projects on spinning disks,
+    // where concurrent reads of different files turn into seek thrashing.
+    public int MaxConcurrentHashes { get; set; } = Environment.ProcessorCount;
+
+    // Size of each read while hashing. Larger reads mean fewer calls per file on
+    // multi-GB models; values below 64 KB are raised to 64 KB.
+    public int HashBufferSize { get; set; } = 1024 * 1024;
+}
@@ -0,0 +1,9 @@
+namespace AECFileProcessor.Core.Models;
+
+public class ProjectStructureOptions
+{
+    // Number of directories created at the same time. Each create is a round trip on a
+    // network share, so several in flight hide that latency; on a local disk it makes
+    // little difference either way.
+    public int MaxConcurrentDirectoryCreates { get; set; } = 16;
+}
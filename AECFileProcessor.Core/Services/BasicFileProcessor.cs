@@ -1,8 +1,10 @@
 using AECFileProcessor.Core.Interfaces;
 using AECFileProcessor.Core.Models;
 using Microsoft.Extensions.Logging;
+using System.Buffers;
 using System.Security.Cryptography;
 using System.Text.Json;
+using System.Text.RegularExpressions;
 
 namespace AECFileProcessor.Core.Services;
 
@@ -10,38 +12,99 @@ public class BasicFileProcessor : IFileProcessor
 {
     private readonly IFileRepository _repository;
     private readonly ILogger<BasicFileProcessor> _logger;
+    private readonly SemaphoreSlim _hashGate;
+    private readonly int _hashChunkSize;
 
-    public BasicFileProcessor(IFileRepository repository, ILogger<BasicFileProcessor> logger)
+    private const int MinHashChunkSize = 64 * 1024;
+
+    // Compiled once; these run against every path segment of every file
+    private static readonly Regex ProjectNumberPattern = new(@"^\d{4,6}$", RegexOptions.Compiled);
+    private static readonly Regex ProjectPrefixPattern = new(@"[Pp]roject(\d+)", RegexOptions.Compiled);
+
+    // Keyword tables for classification, one case-insensitive searcher per category
+    private static readonly (SearchValues<string> Keywords, string Code)[] FileNameDisciplineKeywords =
+    {
+        (KeywordSet("ARCH", "FLOOR", "PLAN"), "A"),
+        (KeywordSet("STRUCT", "BEAM", "COLUMN"), "S"),
+        (KeywordSet("MECH", "HVAC", "AIR"), "M"),
+        (KeywordSet("ELEC", "POWER", "LIGHT"), "E"),
+        (KeywordSet("PLUMB", "WATER", "SEWER"), "P")
+    };
+
+    private static readonly (SearchValues<string> Keywords, string Code)[] PathDisciplineKeywords =
+    {
+        (KeywordSet("ARCHITECTURAL"), "A"),
+        (KeywordSet("STRUCTURAL"), "S"),
+        (KeywordSet("CIVIL"), "C"),
+        (KeywordSet("MECHANICAL"), "M"),
+        (KeywordSet("ELECTRICAL"), "E"),
+        (KeywordSet("PLUMBING"), "P")
+    };
+
+    private static readonly (SearchValues<string> Keywords, string Code)[] PathPhaseKeywords =
+    {
+        (KeywordSet("PRE-DESIGN", "PROGRAMMING"), "PD"),
+        (KeywordSet("SCHEMATIC"), "SD"),
+        (KeywordSet("DESIGN_DEVELOPMENT", "DD"), "DD"),
+        (KeywordSet("CONSTRUCTION_DOCUMENTS", "CD"), "CD"),
+        (KeywordSet("CONSTRUCTION_ADMIN", "CA"), "CA"),
+        (KeywordSet("CLOSEOUT", "CO"), "CO")
+    };
+
+    private static SearchValues<string> KeywordSet(params string[] keywords) =>
+        SearchValues.Create(keywords, StringComparison.OrdinalIgnoreCase);
+
+    public BasicFileProcessor(IFileRepository repository, ILogger<BasicFileProcessor> logger,
+        FileProcessingOptions? options = null)
     {
         _repository = repository;
         _logger = logger;
+
+        var processingOptions = options ?? new FileProcessingOptions();
+        _hashGate = new SemaphoreSlim(Math.Max(1, processingOptions.MaxConcurrentHashes));
+        _hashChunkSize = Math.Max(MinHashChunkSize, processingOptions.HashBufferSize);
     }
 
     public async Task<FileRecord> ProcessFileAsync(string filePath)
     {
         try
         {
-            _logger.LogInformation($"Processing file: {filePath}");
+            _logger.LogInformation("Processing file: {FilePath}", filePath);
 
             // Check if file already processed and unchanged
             var existingRecord = await _repository.GetByPathAsync(filePath);
             var fileInfo = new FileInfo(filePath);
-            var currentHash = await CalculateFileHashAsync(filePath);
 
-            if (existingRecord != null && existingRecord.FileHash == currentHash)
+            // Same size and last-write time as the completed record: skip hashing
+            if (existingRecord != null &&
+                existingRecord.Status == ProcessingStatus.Completed &&
+                existingRecord.FileSize == fileInfo.Length &&
+                existingRecord.ModifiedDate == fileInfo.LastWriteTimeUtc)
             {
-                _logger.LogDebug($"File unchanged, skipping: {filePath}");
+                _logger.LogDebug("File size and timestamp unchanged, skipping: {FilePath}", filePath);
                 return existingRecord;
             }
 
+            var currentHash = await CalculateFileHashAsync(filePath, fileInfo.Length);
+
+            if (existingRecord != null && existingRecord.FileHash == currentHash)
+            {
+                _logger.LogDebug("File unchanged, skipping: {FilePath}", filePath);
+
+                // Touched but not changed: store the new timestamp so later passes skip again
+                existingRecord.ModifiedDate = fileInfo.LastWriteTimeUtc;
+                return await _repository.SaveAsync(existingRecord);
+            }
+
             var fileRecord = new FileRecord
             {
                 FilePath = filePath,
                 FileName = fileInfo.Name,
                 FileSize = fileInfo.Length,
                 FileHash = currentHash,
-                CreatedDate = fileInfo.CreationTime,
-                ModifiedDate = fileInfo.LastWriteTime,
+                // Stored in UTC like ProcessedDate; convert to local time only for display
+                CreatedDate = fileInfo.CreationTimeUtc,
+                ModifiedDate = fileInfo.LastWriteTimeUtc,
                 ProcessedDate = DateTime.UtcNow,
                 Status = ProcessingStatus.Processing
             };
@@ -53,19 +116,19 @@ public class BasicFileProcessor : IFileProcessor
             ParseFileName(fileRecord);
 
             // Extract basic metadata
-            var metadata = await ExtractBasicMetadataAsync(filePath);
-            fileRecord.ExtractedMetadata = JsonSerializer.Serialize(metadata);
+            var metadata = await ExtractBasicMetadataAsync(fileInfo);
+            fileRecord.ExtractedMetadata = JsonSerializer.Serialize(metadata, ExtractedMetadataJsonContext.Default.ExtractedMetadata);
 
             fileRecord.Status = ProcessingStatus.Completed;
 
             var savedRecord = await _repository.SaveAsync(fileRecord);
-            _logger.LogInformation($"Successfully processed file: {filePath}");
+            _logger.LogInformation("Successfully processed file: {FilePath}", filePath);
 
             return savedRecord;
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Failed to process file: {filePath}");
+            _logger.LogError(ex, "Failed to process file: {FilePath}", filePath);
             
             var errorRecord = new FileRecord
             {
@@ -91,12 +154,47 @@ public class BasicFileProcessor : IFileProcessor
         return await _repository.GetByPathAsync(filePath);
     }
 
-    private async Task<string> CalculateFileHashAsync(string filePath)
+    private async Task<string> CalculateFileHashAsync(string filePath, long fileSize)
     {
-        using var stream = File.OpenRead(filePath);
-        using var sha256 = SHA256.Create();
-        var hash = await sha256.ComputeHashAsync(stream);
-        return Convert.ToBase64String(hash);
+        // Chunks no bigger than the file, so small sheets rent small buffers
+        var chunkSize = (int)Math.Clamp(fileSize, MinHashChunkSize, _hashChunkSize);
+
+        // Cap how many files are read at once across parallel callers
+        await _hashGate.WaitAsync();
+        try
+        {
+            // One thread-pool hop for the whole file; the read loop itself is synchronous
+            return await Task.Run(() => HashFile(filePath, chunkSize));
+        }
+        finally
+        {
+            _hashGate.Release();
+        }
+    }
+
+    private static string HashFile(string filePath, int chunkSize)
+    {
+        // Unbuffered: every read is at least 64 KB and goes straight to the hasher
+        using var stream = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read,
+            bufferSize: 0, FileOptions.SequentialScan);
+
+        // Read in large pooled chunks with plain blocking reads
+        using var hasher = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+        var buffer = ArrayPool<byte>.Shared.Rent(chunkSize);
+        try
+        {
+            int bytesRead;
+            while ((bytesRead = stream.Read(buffer, 0, chunkSize)) > 0)
+            {
+                hasher.AppendData(buffer, 0, bytesRead);
+            }
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+
+        return Convert.ToBase64String(hasher.GetHashAndReset());
     }
 
     private string ExtractProjectNumber(string filePath)
@@ -111,20 +209,20 @@ public class BasicFileProcessor : IFileProcessor
             if (underscoreParts.Length >= 2)
             {
                 var lastPart = underscoreParts[^1]; // Last part should be project number
-                if (System.Text.RegularExpressions.Regex.IsMatch(lastPart, @"^\d{4,6}$"))
+                if (ProjectNumberPattern.IsMatch(lastPart))
                 {
                     return lastPart;
                 }
             }
             
             // Fallback: Look for numeric project numbers
-            if (System.Text.RegularExpressions.Regex.IsMatch(part, @"^\d{4,6}$"))
+            if (ProjectNumberPattern.IsMatch(part))
             {
                 return part;
             }
             
             // Look for patterns like "Project12345"
-            var match = System.Text.RegularExpressions.Regex.Match(part, @"[Pp]roject(\d+)");
+            var match = ProjectPrefixPattern.Match(part);
             if (match.Success)
             {
                 return match.Groups[1].Value;
@@ -207,20 +305,7 @@ public class BasicFileProcessor : IFileProcessor
 
     private string InferDisciplineFromFileName(string fileName)
     {
-        var upperName = fileName.ToUpper();
-        
-        if (upperName.Contains("ARCH") || upperName.Contains("FLOOR") || upperName.Contains("PLAN"))
-            return "A";
-        if (upperName.Contains("STRUCT") || upperName.Contains("BEAM") || upperName.Contains("COLUMN"))
-            return "S";
-        if (upperName.Contains("MECH") || upperName.Contains("HVAC") || upperName.Contains("AIR"))
-            return "M";
-        if (upperName.Contains("ELEC") || upperName.Contains("POWER") || upperName.Contains("LIGHT"))
-            return "E";
-        if (upperName.Contains("PLUMB") || upperName.Contains("WATER") || upperName.Contains("SEWER"))
-            return "P";
-            
-        return "UNKNOWN";
+        return MatchKeywords(fileName, FileNameDisciplineKeywords) ?? "UNKNOWN";
     }
 
     private string InferDocumentTypeFromExtension(string fileName)
@@ -241,22 +326,7 @@ public class BasicFileProcessor : IFileProcessor
 
     private string? InferDisciplineFromPath(string filePath)
     {
-        var pathUpper = filePath.ToUpper();
-        
-        if (pathUpper.Contains("ARCHITECTURAL"))
-            return "A";
-        if (pathUpper.Contains("STRUCTURAL"))
-            return "S";
-        if (pathUpper.Contains("CIVIL"))
-            return "C";
-        if (pathUpper.Contains("MECHANICAL"))
-            return "M";
-        if (pathUpper.Contains("ELECTRICAL"))
-            return "E";
-        if (pathUpper.Contains("PLUMBING"))
-            return "P";
-            
-        return null;
+        return MatchKeywords(filePath, PathDisciplineKeywords);
     }
 
     private string InferDisciplineFromDocumentType(string documentType)
@@ -275,21 +345,18 @@ public class BasicFileProcessor : IFileProcessor
 
     private string? InferPhaseFromPath(string filePath)
     {
-        var pathUpper = filePath.ToUpper();
-        
-        if (pathUpper.Contains("PRE-DESIGN") || pathUpper.Contains("PROGRAMMING"))
-            return "PD";
-        if (pathUpper.Contains("SCHEMATIC"))
-            return "SD";
-        if (pathUpper.Contains("DESIGN_DEVELOPMENT") || pathUpper.Contains("DD"))
-            return "DD";
-        if (pathUpper.Contains("CONSTRUCTION_DOCUMENTS") || pathUpper.Contains("CD"))
-            return "CD";
-        if (pathUpper.Contains("CONSTRUCTION_ADMIN") || pathUpper.Contains("CA"))
-            return "CA";
-        if (pathUpper.Contains("CLOSEOUT") || pathUpper.Contains("CO"))
-            return "CO";
-            
+        return MatchKeywords(filePath, PathPhaseKeywords);
+    }
+
+    private static string? MatchKeywords(string text, (SearchValues<string> Keywords, string Code)[] table)
+    {
+        // Tables are ordered by priority, so the first category with any hit wins
+        foreach (var (keywords, code) in table)
+        {
+            if (text.AsSpan().ContainsAny(keywords))
+                return code;
+        }
+
         return null;
     }
 
@@ -317,16 +384,15 @@ public class BasicFileProcessor : IFileProcessor
         return part.All(char.IsDigit);
     }
 
-    private Task<ExtractedMetadata> ExtractBasicMetadataAsync(string filePath)
+    private Task<ExtractedMetadata> ExtractBasicMetadataAsync(FileInfo fileInfo)
     {
         var metadata = new ExtractedMetadata();
-        var extension = Path.GetExtension(filePath).ToLower();
+        var extension = fileInfo.Extension.ToLower();
 
-        // Basic file properties
-        var fileInfo = new FileInfo(filePath);
+        // Basic file properties, reusing the FileInfo already stat'ed by the caller
         metadata.Properties["FileSize"] = fileInfo.Length.ToString();
-        metadata.Properties["CreatedDate"] = fileInfo.CreationTime.ToString();
-        metadata.Properties["ModifiedDate"] = fileInfo.LastWriteTime.ToString();
+        metadata.Properties["CreatedDate"] = fileInfo.CreationTimeUtc.ToString("O");
+        metadata.Properties["ModifiedDate"] = fileInfo.LastWriteTimeUtc.ToString("O");
         metadata.Properties["Extension"] = extension;
 
         // TODO: Add specific extractors for different file types
@@ -0,0 +1,51 @@
+using System.IO.Enumeration;
+
+namespace AECFileProcessor.Core.Services;
+
+public static class FileFilter
+{
+    // Compared case-insensitively so extensions are never lower-cased
+    private static readonly HashSet<string> SupportedExtensions = new(StringComparer.OrdinalIgnoreCase)
+    {
+        ".dwg", ".pdf", ".docx", ".xlsx", ".rvt", ".ifc"
+    };
+
+    // Span lookup so extensions sliced from a path need no string
+    private static readonly HashSet<string>.AlternateLookup<ReadOnlySpan<char>> SupportedExtensionLookup =
+        SupportedExtensions.GetAlternateLookup<ReadOnlySpan<char>>();
+
+    // Shared walk: unreadable folders are skipped, linked files are kept
+    private static readonly EnumerationOptions WalkOptions = new()
+    {
+        RecurseSubdirectories = true,
+        IgnoreInaccessible = true,
+        AttributesToSkip = 0
+    };
+
+    public static IEnumerable<string> EnumerateFiles(string rootPath)
+    {
+        // Full paths are only built for files that pass the filter
+        return new FileSystemEnumerable<string>(rootPath, (ref FileSystemEntry entry) => entry.ToFullPath(), WalkOptions)
+        {
+            ShouldIncludePredicate = (ref FileSystemEntry entry) => !entry.IsDirectory && IsSupportedFileName(entry.FileName),
+            // Linked folders are not walked, so a link back up cannot loop the scan
+            ShouldRecursePredicate = (ref FileSystemEntry entry) => (entry.Attributes & FileAttributes.ReparsePoint) == 0
+        };
+    }
+
+    public static bool ShouldProcessFile(string filePath)
+    {
+        // Work on slices of the path to avoid substrings
+        return IsSupportedFileName(Path.GetFileName(filePath.AsSpan()));
+    }
+
+    private static bool IsSupportedFileName(ReadOnlySpan<char> fileName)
+    {
+        // Skip temporary files (ordinal checks)
+        if (fileName.StartsWith('~') || fileName.StartsWith(".tmp", StringComparison.Ordinal) || fileName.Contains('$'))
+            return false;
+
+        // Only process known AEC file types
+        return SupportedExtensionLookup.Contains(Path.GetExtension(fileName));
+    }
+}
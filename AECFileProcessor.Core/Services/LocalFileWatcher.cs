@@ -10,7 +10,11 @@ public class LocalFileWatcher : IDisposable
     private readonly IFileProcessor _processor;
     private readonly ILogger<LocalFileWatcher> _logger;
     private readonly Timer _batchTimer;
-    private readonly ConcurrentQueue<string> _fileQueue = new();
+    // Pending paths keyed by path, so a file saved many times between batches (or reported
+    // by both Created and Changed) is held and processed once. Memory is bounded by the
+    // number of distinct pending files rather than the number of events.
+    private readonly ConcurrentDictionary<string, byte> _pendingFiles = new();
+    private int _batchRunning;
     private bool _disposed = false;
 
     public LocalFileWatcher(string watchPath, IFileProcessor processor, ILogger<LocalFileWatcher> logger)
@@ -35,7 +39,7 @@ public class LocalFileWatcher : IDisposable
     public void StartWatching()
     {
         _watcher.EnableRaisingEvents = true;
-        _logger.LogInformation($"Started watching {_watcher.Path}");
+        _logger.LogInformation("Started watching {Path}", _watcher.Path);
         
         // Process existing files
         _ = Task.Run(ProcessExistingFilesAsync);
@@ -49,42 +53,48 @@ public class LocalFileWatcher : IDisposable
 
     private void OnFileChanged(object sender, FileSystemEventArgs e)
     {
-        if (ShouldProcessFile(e.FullPath))
+        if (FileFilter.ShouldProcessFile(e.FullPath) && _pendingFiles.TryAdd(e.FullPath, 0))
         {
-            _fileQueue.Enqueue(e.FullPath);
-            _logger.LogDebug($"Queued file: {e.FullPath}");
+            _logger.LogDebug("Queued file: {FilePath}", e.FullPath);
         }
     }
 
     private void OnFileRenamed(object sender, RenamedEventArgs e)
     {
-        if (ShouldProcessFile(e.FullPath))
+        if (FileFilter.ShouldProcessFile(e.FullPath))
         {
-            _fileQueue.Enqueue(e.FullPath);
+            _pendingFiles.TryAdd(e.FullPath, 0);
         }
     }
 
-    private bool ShouldProcessFile(string filePath)
+    private async void ProcessQueuedFiles(object? state)
     {
-        var extension = Path.GetExtension(filePath).ToLower();
-        var fileName = Path.GetFileName(filePath);
-        
-        // Skip temporary files
-        if (fileName.StartsWith("~") || fileName.StartsWith(".tmp") || fileName.Contains("$"))
-            return false;
-            
-        // Only process known AEC file types
-        return extension is ".dwg" or ".pdf" or ".docx" or ".xlsx" or ".rvt" or ".ifc";
+        // The timer fires every 5 seconds whether or not the last batch has finished. Let
+        // one batch run at a time so a slow initial scan doesn't stack a second set of
+        // workers on top of the first; files queued meanwhile wait for the next tick.
+        if (Interlocked.Exchange(ref _batchRunning, 1) == 1)
+        {
+            return;
+        }
+
+        try
+        {
+            await ProcessPendingFilesAsync();
+        }
+        finally
+        {
+            Volatile.Write(ref _batchRunning, 0);
+        }
     }
 
-    private async void ProcessQueuedFiles(object? state)
+    private async Task ProcessPendingFilesAsync()
     {
         var filesToProcess = new List<string>();
         
-        // Dequeue all pending files
-        while (_fileQueue.TryDequeue(out var filePath))
+        // Take all pending files; a path changed again after removal is re-added for the next batch
+        foreach (var filePath in _pendingFiles.Keys)
         {
-            if (File.Exists(filePath))
+            if (_pendingFiles.TryRemove(filePath, out _) && File.Exists(filePath))
             {
                 filesToProcess.Add(filePath);
             }
@@ -92,28 +102,23 @@ public class LocalFileWatcher : IDisposable
 
         if (filesToProcess.Any())
         {
-            _logger.LogInformation($"Processing batch of {filesToProcess.Count} files");
+            _logger.LogInformation("Processing batch of {Count} files", filesToProcess.Count);
             
-            // Process files in parallel with limited concurrency
-            var semaphore = new SemaphoreSlim(Environment.ProcessorCount);
-            var tasks = filesToProcess.Select(async filePath =>
+            // Process files in parallel with limited concurrency. A fixed set of workers pulls
+            // from the batch, so a large initial scan never has more than ProcessorCount
+            // files in flight instead of one pending task per queued file.
+            var options = new ParallelOptions { MaxDegreeOfParallelism = Environment.ProcessorCount };
+            await Parallel.ForEachAsync(filesToProcess, options, async (filePath, _) =>
             {
-                await semaphore.WaitAsync();
                 try
                 {
                     await _processor.ProcessFileAsync(filePath);
                 }
                 catch (Exception ex)
                 {
-                    _logger.LogError(ex, $"Failed to process file: {filePath}");
-                }
-                finally
-                {
-                    semaphore.Release();
+                    _logger.LogError(ex, "Failed to process file: {FilePath}", filePath);
                 }
             });
-            
-            await Task.WhenAll(tasks);
         }
     }
 
@@ -123,16 +128,16 @@ public class LocalFileWatcher : IDisposable
         {
             _logger.LogInformation("Scanning for existing files...");
             
-            var files = Directory.GetFiles(_watcher.Path, "*", SearchOption.AllDirectories)
-                .Where(ShouldProcessFile)
-                .ToList();
-                
-            _logger.LogInformation($"Found {files.Count} existing files to process");
-            
-            foreach (var file in files)
+            // Queue files as the walk finds them rather than materialising the whole tree
+            // first; the batch timer can start on early files while the scan continues
+            var count = 0;
+            foreach (var file in FileFilter.EnumerateFiles(_watcher.Path))
             {
-                _fileQueue.Enqueue(file);
+                _pendingFiles.TryAdd(file, 0);
+                count++;
             }
+
+            _logger.LogInformation("Found {Count} existing files to process", count);
         }
         catch (Exception ex)
         {
@@ -1,11 +1,15 @@
 using AECFileProcessor.Core.Interfaces;
+using AECFileProcessor.Core.Models;
 using Microsoft.Extensions.Logging;
+using System.Buffers;
+using System.IO.Enumeration;
 
 namespace AECFileProcessor.Core.Services;
 
 public class ProjectStructureService : IProjectStructureService
 {
     private readonly ILogger<ProjectStructureService> _logger;
+    private readonly ProjectStructureOptions _options;
 
     private static readonly string[] StandardDirectories = new[]
     {
@@ -111,74 +115,200 @@ public class ProjectStructureService : IProjectStructureService
         "12_ARCHIVE"
     };
 
-    public ProjectStructureService(ILogger<ProjectStructureService> logger)
+    // Directories with no standard children; creating these creates their parents
+    private static readonly string[] LeafDirectories = StandardDirectories
+        .Where(directory => !StandardDirectories.Any(other => other.StartsWith(directory + "/", StringComparison.Ordinal)))
+        .Select(directory => directory.Replace('/', Path.DirectorySeparatorChar))
+        .ToArray();
+
+    // Standard directories go three levels deep, so status checks list no further
+    private static readonly EnumerationOptions StandardLevelsOptions = new()
+    {
+        RecurseSubdirectories = true,
+        MaxRecursionDepth = 2,
+        IgnoreInaccessible = true,
+        AttributesToSkip = 0
+    };
+
+    private static readonly StringComparer DirectoryNameComparer =
+        OperatingSystem.IsWindows() || OperatingSystem.IsMacOS() ? StringComparer.OrdinalIgnoreCase : StringComparer.Ordinal;
+
+    // Standard directories with standard children; the only ones status checks descend into
+    private static readonly HashSet<string> StandardParentDirectories = new(
+        StandardDirectories.Where(directory => StandardDirectories.Any(other => other.StartsWith(directory + "/", StringComparison.Ordinal))),
+        DirectoryNameComparer);
+
+    // Invalid file name characters plus separators and colons on every platform
+    private static readonly SearchValues<char> UnsafePathComponentChars =
+        SearchValues.Create(Path.GetInvalidFileNameChars().Concat(new[] { '/', '\\', ':' }).Distinct().ToArray());
+
+    // README files for key directories
+    private static readonly (string Directory, string Content)[] ReadmeFiles =
+    {
+        Readme("02_DRAWINGS/Current", "Place current revision drawings here, organized by discipline."),
+        Readme("02_DRAWINGS/Superseded", "Archive superseded drawing revisions here."),
+        Readme("03_SPECIFICATIONS", "Technical specifications organized by CSI MasterFormat divisions."),
+        Readme("04_CALCULATIONS", "Engineering calculations organized by discipline."),
+        Readme("08_MODELS_CAD", "BIM models, CAD files, and 3D models."),
+        Readme("10_CLOSEOUT", "Final project deliverables including as-built drawings and O&M manuals.")
+    };
+
+    public ProjectStructureService(ILogger<ProjectStructureService> logger, ProjectStructureOptions? options = null)
     {
         _logger = logger;
+        _options = options ?? new ProjectStructureOptions();
     }
 
     public async Task<bool> CreateProjectStructureAsync(string projectPath, string projectName, string projectNumber)
     {
-        try
+        var results = await CreateProjectStructuresAsync(new[]
         {
-            var fullProjectPath = Path.Combine(projectPath, $"{projectName}_{projectNumber}");
-            
-            _logger.LogInformation($"Creating project structure at: {fullProjectPath}");
+            new ProjectStructureRequest { ProjectPath = projectPath, ProjectName = projectName, ProjectNumber = projectNumber }
+        });
+
+        return results[0];
+    }
 
-            // Create root project directory
-            if (!Directory.Exists(fullProjectPath))
+    public async Task<IReadOnlyList<bool>> CreateProjectStructuresAsync(IReadOnlyList<ProjectStructureRequest> requests)
+    {
+        var projects = new List<ProjectCreation>(requests.Count);
+
+        foreach (var request in requests)
+        {
+            var project = new ProjectCreation(request);
+            projects.Add(project);
+
+            // Reject names that could step outside the base path
+            if (!IsSafePathComponent(request.ProjectName) || !IsSafePathComponent(request.ProjectNumber))
             {
-                Directory.CreateDirectory(fullProjectPath);
-                _logger.LogInformation($"Created root project directory: {fullProjectPath}");
+                project.Failed = 1;
+                _logger.LogError("Invalid project name or number: {ProjectName}_{ProjectNumber}", request.ProjectName, request.ProjectNumber);
+                continue;
             }
 
-            // Create all standard directories
-            var createdCount = 0;
-            var skippedCount = 0;
+            try
+            {
+                project.FullProjectPath = Path.Combine(request.ProjectPath, $"{request.ProjectName}_{request.ProjectNumber}");
+                project.PathPrefix = project.FullProjectPath + Path.DirectorySeparatorChar;
+                
+                _logger.LogInformation("Creating project structure at: {ProjectPath}", project.FullProjectPath);
 
-            foreach (var directory in StandardDirectories)
+                // Create root project directory; if new, its children need no existence checks
+                project.IsNewProject = !Directory.Exists(project.FullProjectPath);
+                if (project.IsNewProject)
+                {
+                    Directory.CreateDirectory(project.FullProjectPath);
+                    _logger.LogInformation("Created root project directory: {ProjectPath}", project.FullProjectPath);
+                }
+            }
+            catch (Exception ex)
+            {
+                MarkFailed(project, ex);
+            }
+        }
+
+        // Create every project's leaves in one bounded parallel pool
+        var leaves = projects
+            .Where(project => project.Failed == 0)
+            .SelectMany(project => LeafDirectories.Select(directory => (Project: project, Directory: directory)));
+
+        var parallelOptions = new ParallelOptions { MaxDegreeOfParallelism = Math.Max(1, _options.MaxConcurrentDirectoryCreates) };
+        await Parallel.ForEachAsync(leaves, parallelOptions, (leaf, _) =>
+        {
+            var (project, directory) = leaf;
+            if (project.Failed != 0)
             {
-                var fullPath = Path.Combine(fullProjectPath, directory);
+                return ValueTask.CompletedTask;
+            }
+
+            try
+            {
+                // Leaves use the native separator, so a plain concatenation is a full path
+                var fullPath = project.PathPrefix + directory;
                 
-                if (!Directory.Exists(fullPath))
+                if (project.IsNewProject || !Directory.Exists(fullPath))
                 {
                     Directory.CreateDirectory(fullPath);
-                    createdCount++;
-                    _logger.LogDebug($"Created directory: {directory}");
+                    Interlocked.Increment(ref project.CreatedCount);
+                    _logger.LogDebug("Created directory: {Directory}", directory);
                 }
                 else
                 {
-                    skippedCount++;
-                    _logger.LogDebug($"Directory already exists: {directory}");
+                    Interlocked.Increment(ref project.SkippedCount);
+                    _logger.LogDebug("Directory already exists: {Directory}", directory);
                 }
             }
+            catch (Exception ex)
+            {
+                MarkFailed(project, ex);
+            }
 
-            // Create a project info file
-            await CreateProjectInfoFileAsync(fullProjectPath, projectName, projectNumber);
+            return ValueTask.CompletedTask;
+        });
 
-            // Create README files in key directories
-            await CreateReadmeFilesAsync(fullProjectPath);
+        var results = new bool[projects.Count];
+        for (var i = 0; i < projects.Count; i++)
+        {
+            var project = projects[i];
+            if (project.Failed != 0)
+            {
+                continue;
+            }
 
-            _logger.LogInformation($"Project structure creation completed. Created: {createdCount}, Skipped: {skippedCount}");
-            return true;
+            try
+            {
+                // Create a project info file
+                await CreateProjectInfoFileAsync(project.FullProjectPath, project.Request.ProjectName, project.Request.ProjectNumber);
+
+                // Create README files in key directories
+                await CreateReadmeFilesAsync(project.FullProjectPath);
+
+                _logger.LogInformation("Project structure creation completed. Created: {CreatedCount}, Skipped: {SkippedCount}", project.CreatedCount, project.SkippedCount);
+                results[i] = true;
+            }
+            catch (Exception ex)
+            {
+                MarkFailed(project, ex);
+            }
         }
-        catch (Exception ex)
+
+        return results;
+    }
+
+    private static bool IsSafePathComponent(string value)
+    {
+        return !string.IsNullOrEmpty(value) &&
+               value[0] != '.' &&
+               value.AsSpan().IndexOfAny(UnsafePathComponentChars) < 0;
+    }
+
+    private void MarkFailed(ProjectCreation project, Exception ex)
+    {
+        // Log once per project even when several of its leaves fail in parallel
+        if (Interlocked.Exchange(ref project.Failed, 1) == 0)
         {
-            _logger.LogError(ex, $"Failed to create project structure at: {projectPath}");
-            return false;
+            _logger.LogError(ex, "Failed to create project structure at: {ProjectPath}", project.Request.ProjectPath);
         }
     }
 
-    public async Task<bool> ValidateProjectStructureAsync(string projectPath)
+    public Task<bool> ValidateProjectStructureAsync(string projectPath)
     {
         try
         {
-            var status = await GetProjectStructureStatusAsync(projectPath);
-            return status.IsValidStructure;
+            // Only the verdict is needed, so just count matches
+            var presentDirectories = ListPresentDirectories(projectPath);
+            var existingCount = StandardDirectories.Count(presentDirectories.Contains);
+
+            return Task.FromResult(IsValidDirectoryCount(existingCount));
+        }
+        catch (DirectoryNotFoundException)
+        {
+            return Task.FromResult(false);
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Failed to validate project structure at: {projectPath}");
-            return false;
+            _logger.LogError(ex, "Failed to validate project structure at: {ProjectPath}", projectPath);
+            return Task.FromResult(false);
         }
     }
 
@@ -188,7 +318,13 @@ public class ProjectStructureService : IProjectStructureService
         
         try
         {
-            if (!Directory.Exists(projectPath))
+            // A missing root makes the listing throw DirectoryNotFoundException
+            HashSet<string> presentDirectories;
+            try
+            {
+                presentDirectories = ListPresentDirectories(projectPath);
+            }
+            catch (DirectoryNotFoundException)
             {
                 status.MissingDirectories.AddRange(StandardDirectories);
                 return status;
@@ -205,9 +341,7 @@ public class ProjectStructureService : IProjectStructureService
 
             foreach (var directory in StandardDirectories)
             {
-                var fullPath = Path.Combine(projectPath, directory);
-                
-                if (Directory.Exists(fullPath))
+                if (presentDirectories.Contains(directory))
                 {
                     status.ExistingDirectories.Add(directory);
                 }
@@ -217,20 +351,49 @@ public class ProjectStructureService : IProjectStructureService
                 }
             }
 
-            // Consider structure valid if at least 80% of directories exist
-            var validThreshold = StandardDirectories.Length * 0.8;
-            status.IsValidStructure = status.ExistingDirectories.Count >= validThreshold;
+            status.IsValidStructure = IsValidDirectoryCount(status.ExistingDirectories.Count);
 
-            _logger.LogDebug($"Project structure validation: {status.ExistingDirectories.Count}/{StandardDirectories.Length} directories exist");
+            _logger.LogDebug("Project structure validation: {ExistingCount}/{TotalCount} directories exist", status.ExistingDirectories.Count, StandardDirectories.Length);
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Failed to get project structure status for: {projectPath}");
+            _logger.LogError(ex, "Failed to get project structure status for: {ProjectPath}", projectPath);
         }
 
         return status;
     }
 
+    private static HashSet<string> ListPresentDirectories(string projectPath)
+    {
+        // One listing instead of an existence check per standard directory
+        var directories = new FileSystemEnumerable<string>(projectPath, ToStandardRelativePath, StandardLevelsOptions)
+        {
+            ShouldIncludePredicate = (ref FileSystemEntry entry) => entry.IsDirectory,
+            ShouldRecursePredicate = (ref FileSystemEntry entry) => StandardParentDirectories.Contains(ToStandardRelativePath(ref entry))
+        };
+
+        return new HashSet<string>(directories, DirectoryNameComparer);
+    }
+
+    private static string ToStandardRelativePath(ref FileSystemEntry entry)
+    {
+        // Build the relative path from the enumerator's buffers
+        var parent = entry.Directory[entry.RootDirectory.Length..].TrimStart(Path.DirectorySeparatorChar);
+        if (parent.IsEmpty)
+        {
+            return entry.FileName.ToString();
+        }
+
+        var relativePath = string.Concat(parent, "/", entry.FileName);
+        return Path.DirectorySeparatorChar == '/' ? relativePath : relativePath.Replace(Path.DirectorySeparatorChar, '/');
+    }
+
+    private static bool IsValidDirectoryCount(int existingCount)
+    {
+        // Consider structure valid if at least 80% of directories exist
+        return existingCount >= StandardDirectories.Length * 0.8;
+    }
+
     private async Task CreateProjectInfoFileAsync(string projectPath, string projectName, string projectNumber)
     {
         var infoFilePath = Path.Combine(projectPath, "PROJECT_INFO.md");
@@ -289,34 +452,72 @@ Files should follow the format: `Phase_DocumentType_Description_Revision_Date.ex
 - **CHG** - Change Order
 """;
 
-        await File.WriteAllTextAsync(infoFilePath, content);
-        _logger.LogInformation("Created PROJECT_INFO.md file");
+        if (await WriteAllTextAtomicAsync(infoFilePath, content))
+        {
+            _logger.LogInformation("Created PROJECT_INFO.md file");
+        }
     }
 
-    private Task CreateReadmeFilesAsync(string projectPath)
+    private async Task CreateReadmeFilesAsync(string projectPath)
     {
-        var readmeContent = new Dictionary<string, string>
-        {
-            ["02_DRAWINGS/Current"] = "Place current revision drawings here, organized by discipline.",
-            ["02_DRAWINGS/Superseded"] = "Archive superseded drawing revisions here.",
-            ["03_SPECIFICATIONS"] = "Technical specifications organized by CSI MasterFormat divisions.",
-            ["04_CALCULATIONS"] = "Engineering calculations organized by discipline.",
-            ["08_MODELS_CAD"] = "BIM models, CAD files, and 3D models.",
-            ["10_CLOSEOUT"] = "Final project deliverables including as-built drawings and O&M manuals."
-        };
-
-        foreach (var (directory, content) in readmeContent)
+        foreach (var (directory, content) in ReadmeFiles)
         {
             var readmePath = Path.Combine(projectPath, directory, "README.md");
             var readmeDir = Path.GetDirectoryName(readmePath)!;
             
             if (Directory.Exists(readmeDir) && !File.Exists(readmePath))
             {
-                File.WriteAllText(readmePath, $"# {Path.GetFileName(directory)}\n\n{content}");
-                _logger.LogDebug($"Created README.md in {directory}");
+                if (await WriteAllTextAtomicAsync(readmePath, content))
+                {
+                    _logger.LogDebug("Created README.md in {Directory}", directory);
+                }
             }
         }
-        
-        return Task.CompletedTask;
     }
-}
\ No newline at end of file
+
+    private static async Task<bool> WriteAllTextAtomicAsync(string path, string content)
+    {
+        // Write to a unique temp file and move into place; false if the file already existed
+        var tempPath = $"{path}.{Path.GetRandomFileName()}.tmp";
+        try
+        {
+            await File.WriteAllTextAsync(tempPath, content);
+            File.Move(tempPath, path, overwrite: false);
+            return true;
+        }
+        catch (IOException) when (File.Exists(path))
+        {
+            return false;
+        }
+        finally
+        {
+            if (File.Exists(tempPath))
+            {
+                File.Delete(tempPath);
+            }
+        }
+    }
+
+    private static (string Directory, string Content) Readme(string directory, string description)
+    {
+        return (directory, $"# {Path.GetFileName(directory)}\n\n{description}");
+    }
+
+    private sealed class ProjectCreation
+    {
+        public ProjectCreation(ProjectStructureRequest request)
+        {
+            Request = request;
+        }
+
+        public ProjectStructureRequest Request { get; }
+        public string FullProjectPath { get; set; } = string.Empty;
+        public string PathPrefix { get; set; } = string.Empty;
+        public bool IsNewProject { get; set; }
+
+        // Fields rather than properties so workers can update them with Interlocked
+        public int CreatedCount;
+        public int SkippedCount;
+        public int Failed;
+    }
+}
@@ -0,0 +1,46 @@
+using AECFileProcessor.Core.Models;
+using AECFileProcessor.Core.Services;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace AECFileProcessor.Tests;
+
+public class BasicFileProcessorTests : IDisposable
+{
+    private readonly string _rootPath;
+    private readonly BasicFileProcessor _processor =
+        new(new InMemoryFileRepository(), NullLogger<BasicFileProcessor>.Instance);
+
+    public BasicFileProcessorTests()
+    {
+        _rootPath = Path.Combine(Path.GetTempPath(), $"aec-processor-{Guid.NewGuid():N}");
+        Directory.CreateDirectory(_rootPath);
+    }
+
+    public void Dispose()
+    {
+        Directory.Delete(_rootPath, recursive: true);
+    }
+
+    [Fact]
+    public async Task ProcessFileAsync_TouchedFileIsHashedOnceThenSkipped()
+    {
+        var filePath = Path.Combine(_rootPath, "CD_DWG_FloorPlan_R1_031524.dwg");
+        await File.WriteAllTextAsync(filePath, "drawing");
+        Assert.Equal(ProcessingStatus.Completed, (await _processor.ProcessFileAsync(filePath)).Status);
+
+        // Touched, not changed: the first pass re-hashes and records the new timestamp
+        var touchedAt = File.GetLastWriteTimeUtc(filePath).AddMinutes(1);
+        File.SetLastWriteTimeUtc(filePath, touchedAt);
+        var rehashed = await _processor.ProcessFileAsync(filePath);
+        Assert.Equal(ProcessingStatus.Completed, rehashed.Status);
+        Assert.Equal(touchedAt, rehashed.ModifiedDate);
+
+        // Hold the file exclusively so any attempt to hash it fails the record; the second
+        // pass must be answered from size and timestamp alone
+        using (new FileStream(filePath, FileMode.Open, FileAccess.ReadWrite, FileShare.None))
+        {
+            var skipped = await _processor.ProcessFileAsync(filePath);
+            Assert.Equal(ProcessingStatus.Completed, skipped.Status);
+        }
+    }
+}
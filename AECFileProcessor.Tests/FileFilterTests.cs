@@ -0,0 +1,72 @@
+using AECFileProcessor.Core.Services;
+
+namespace AECFileProcessor.Tests;
+
+public class FileFilterTests : IDisposable
+{
+    // The walk starts at rootPath; the outside folder holds the target of a linked file
+    private readonly string _sandboxPath;
+    private readonly string _rootPath;
+    private readonly string _outsidePath;
+
+    public FileFilterTests()
+    {
+        _sandboxPath = Path.Combine(Path.GetTempPath(), $"aec-filter-{Guid.NewGuid():N}");
+        _rootPath = Path.Combine(_sandboxPath, "root");
+        _outsidePath = Path.Combine(_sandboxPath, "outside");
+        Directory.CreateDirectory(_rootPath);
+        Directory.CreateDirectory(_outsidePath);
+    }
+
+    public void Dispose()
+    {
+        Directory.Delete(_sandboxPath, recursive: true);
+    }
+
+    [Theory]
+    [InlineData("CD_DWG_FloorPlan_R1_031524.dwg", true)]
+    [InlineData("Spec.PDF", true)]
+    [InlineData("Model.Rvt", true)]
+    [InlineData("Calcs.xlsx", true)]
+    [InlineData("Notes.txt", false)]
+    [InlineData("README", false)]
+    [InlineData("~$Spec.docx", false)]
+    [InlineData("~Plan.dwg", false)]
+    [InlineData(".tmpPlan.dwg", false)]
+    [InlineData("Plan$1.dwg", false)]
+    public void ShouldProcessFile_AppliesNameRules(string fileName, bool expected)
+    {
+        Assert.Equal(expected, FileFilter.ShouldProcessFile(Path.Combine(_rootPath, "02_DRAWINGS", fileName)));
+    }
+
+    [Fact]
+    public void EnumerateFiles_ReturnsSupportedFilesInTree()
+    {
+        var subPath = Path.Combine(_rootPath, "02_DRAWINGS");
+        Directory.CreateDirectory(subPath);
+        File.WriteAllText(Path.Combine(_rootPath, "Plan.dwg"), "");
+        File.WriteAllText(Path.Combine(_rootPath, "Notes.txt"), "");
+        File.WriteAllText(Path.Combine(subPath, "Spec.PDF"), "");
+        File.WriteAllText(Path.Combine(subPath, "~$Spec.docx"), "");
+
+        var files = FileFilter.EnumerateFiles(_rootPath).Order(StringComparer.Ordinal);
+
+        Assert.Equal(new[] { Path.Combine(subPath, "Spec.PDF"), Path.Combine(_rootPath, "Plan.dwg") }, files);
+    }
+
+    [Fact]
+    public void EnumerateFiles_IncludesLinkedFilesWithoutWalkingLinkedFolders()
+    {
+        var targetPath = Path.Combine(_outsidePath, "Shared.dwg");
+        File.WriteAllText(targetPath, "");
+        File.WriteAllText(Path.Combine(_rootPath, "Plan.dwg"), "");
+        File.CreateSymbolicLink(Path.Combine(_rootPath, "Linked.dwg"), targetPath);
+
+        // A link back up to the root would loop the walk if it were followed
+        Directory.CreateSymbolicLink(Path.Combine(_rootPath, "Loop"), _rootPath);
+
+        var files = FileFilter.EnumerateFiles(_rootPath).Order(StringComparer.Ordinal);
+
+        Assert.Equal(new[] { Path.Combine(_rootPath, "Linked.dwg"), Path.Combine(_rootPath, "Plan.dwg") }, files);
+    }
+}
@@ -0,0 +1,103 @@
+using AECFileProcessor.Core.Interfaces;
+using AECFileProcessor.Core.Services;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace AECFileProcessor.Tests;
+
+public class ProjectStructureServiceTests : IDisposable
+{
+    // Projects are created in basePath; its parent is checked to prove nothing escaped
+    private readonly string _sandboxPath;
+    private readonly string _basePath;
+    private readonly ProjectStructureService _service = new(NullLogger<ProjectStructureService>.Instance);
+
+    public ProjectStructureServiceTests()
+    {
+        _sandboxPath = Path.Combine(Path.GetTempPath(), $"aec-structure-{Guid.NewGuid():N}");
+        _basePath = Path.Combine(_sandboxPath, "base");
+        Directory.CreateDirectory(_basePath);
+    }
+
+    public void Dispose()
+    {
+        Directory.Delete(_sandboxPath, recursive: true);
+    }
+
+    [Theory]
+    [InlineData("..", "12345")]
+    [InlineData("../x", "12345")]
+    [InlineData("a/b", "12345")]
+    [InlineData("a\\b", "12345")]
+    [InlineData("C:x", "12345")]
+    [InlineData(".hidden", "12345")]
+    [InlineData("Tower", "")]
+    public async Task CreateProjectStructureAsync_RejectsUnsafeNameOrNumber(string projectName, string projectNumber)
+    {
+        var created = await _service.CreateProjectStructureAsync(_basePath, projectName, projectNumber);
+
+        Assert.False(created);
+        Assert.Empty(Directory.EnumerateFileSystemEntries(_basePath));
+        Assert.Equal(new[] { _basePath }, Directory.EnumerateFileSystemEntries(_sandboxPath));
+    }
+
+    [Fact]
+    public async Task CreateProjectStructureAsync_CreatesTreeForValidName()
+    {
+        var created = await _service.CreateProjectStructureAsync(_basePath, "Tower", "12345");
+
+        var projectPath = Path.Combine(_basePath, "Tower_12345");
+        Assert.True(created);
+        Assert.True(File.Exists(Path.Combine(projectPath, "PROJECT_INFO.md")));
+        Assert.True(Directory.Exists(Path.Combine(projectPath, "02_DRAWINGS", "Current", "Civil")));
+        Assert.True(await _service.ValidateProjectStructureAsync(projectPath));
+        Assert.Empty((await _service.GetProjectStructureStatusAsync(projectPath)).MissingDirectories);
+    }
+
+    [Fact]
+    public async Task GetProjectStructureStatusAsync_ReportsDeepFolderMissingAndIgnoresUserFolders()
+    {
+        await _service.CreateProjectStructureAsync(_basePath, "Tower", "12345");
+        var projectPath = Path.Combine(_basePath, "Tower_12345");
+        Directory.Delete(Path.Combine(projectPath, "02_DRAWINGS", "Current", "Civil"));
+        Directory.CreateDirectory(Path.Combine(projectPath, "02_DRAWINGS", "Current", "Landscape", "Planting"));
+
+        var status = await _service.GetProjectStructureStatusAsync(projectPath);
+
+        Assert.Equal(new[] { "02_DRAWINGS/Current/Civil" }, status.MissingDirectories);
+        Assert.DoesNotContain("02_DRAWINGS/Current/Landscape", status.ExistingDirectories);
+        Assert.Contains("02_DRAWINGS/Current/Structural", status.ExistingDirectories);
+    }
+
+    [Fact]
+    public async Task CreateProjectStructuresAsync_FailedProjectDoesNotStopTheOthers()
+    {
+        // A file where the middle project's base directory should be
+        var blockedBasePath = Path.Combine(_basePath, "blocked");
+        await File.WriteAllTextAsync(blockedBasePath, "");
+
+        var results = await _service.CreateProjectStructuresAsync(new[]
+        {
+            new ProjectStructureRequest { ProjectPath = _basePath, ProjectName = "Tower", ProjectNumber = "12345" },
+            new ProjectStructureRequest { ProjectPath = blockedBasePath, ProjectName = "Annex", ProjectNumber = "23456" },
+            new ProjectStructureRequest { ProjectPath = _basePath, ProjectName = "Garage", ProjectNumber = "34567" }
+        });
+
+        Assert.Equal(new[] { true, false, true }, results);
+        Assert.True(await _service.ValidateProjectStructureAsync(Path.Combine(_basePath, "Tower_12345")));
+        Assert.True(await _service.ValidateProjectStructureAsync(Path.Combine(_basePath, "Garage_34567")));
+    }
+
+    [Fact]
+    public async Task CreateProjectStructureAsync_ConcurrentCreatorsLeaveOneInfoFileAndNoTempFiles()
+    {
+        var creators = Enumerable.Range(0, 4)
+            .Select(_ => Task.Run(() => _service.CreateProjectStructureAsync(_basePath, "Tower", "12345")));
+
+        var results = await Task.WhenAll(creators);
+
+        var projectPath = Path.Combine(_basePath, "Tower_12345");
+        Assert.All(results, Assert.True);
+        Assert.StartsWith("# Tower", await File.ReadAllTextAsync(Path.Combine(projectPath, "PROJECT_INFO.md")));
+        Assert.Empty(Directory.EnumerateFiles(projectPath, "*.tmp", SearchOption.AllDirectories));
+    }
+}